@@ -0,0 +1,35 @@
+"""Custom response classes for the API."""
+
+from __future__ import annotations
+
+from typing import Mapping
+
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+
+
+class ModelResponse(Response):
+    """JSON response rendered directly from a pydantic model.
+
+    Returning this from an endpoint bypasses FastAPI's ``response_model``
+    validation and ``jsonable_encoder`` pass; the model is serialized once,
+    straight to bytes, by pydantic-core using the field aliases. Endpoints
+    should keep ``response_model`` on the route so the OpenAPI schema is
+    unchanged.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        media_type: str | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(content, status_code, headers, media_type, background)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content, by_alias=True)
@@ -12,6 +12,7 @@ from fastapi import APIRouter, HTTPException, status
 
 from ..db import get_conn
 from ..logging_utils import get_request_id, log_json
+from ..responses import ModelResponse
 from ..schemas import (
     ClockInRequest,
     ClockInResponse,
@@ -34,7 +35,7 @@ def _extract_status(row: Optional[dict[str, object]]) -> str:
 
 
 @router.post("/clock-in", response_model=ClockInResponse)
-def clock_in(payload: ClockInRequest) -> ClockInResponse:
+def clock_in(payload: ClockInRequest) -> ModelResponse:
     """Execute the clock-in stored procedure and return the status."""
 
     device_date = payload.device_date or datetime.utcnow()
@@ -120,13 +121,15 @@ def clock_in(payload: ClockInRequest) -> ClockInResponse:
         }
     )
 
-    return ClockInResponse(
-        status=sp_status, work_order_collection_id=work_order_collection_id
+    return ModelResponse(
+        ClockInResponse(
+            status=sp_status, work_order_collection_id=work_order_collection_id
+        )
     )
 
 
 @router.post("/clock-out", response_model=ClockOutResponse)
-def clock_out(payload: ClockOutRequest) -> ClockOutResponse:
+def clock_out(payload: ClockOutRequest) -> ModelResponse:
     """Execute the clock-out stored procedure and return the status."""
 
     device_time_str = (payload.device_time or datetime.utcnow()).strftime("%Y-%m-%dT%H:%M:%S")
@@ -202,4 +205,4 @@ def clock_out(payload: ClockOutRequest) -> ClockOutResponse:
         }
     )
 
-    return ClockOutResponse(status=sp_status)
+    return ModelResponse(ClockOutResponse(status=sp_status))
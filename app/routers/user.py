@@ -11,6 +11,7 @@ from fastapi import APIRouter, HTTPException, status
 
 from ..db import get_conn
 from ..logging_utils import get_request_id, log_json
+from ..responses import ModelResponse
 from ..schemas import UserStatusResponse
 
 _logger = logging.getLogger(__name__)
@@ -59,7 +60,7 @@ def _safe_get(row: Optional[dict[str, object]], key: str) -> Optional[object]:
 
 
 @router.get("/users/{employee_id}", response_model=UserStatusResponse)
-def get_user_status(employee_id: str) -> UserStatusResponse:
+def get_user_status(employee_id: str) -> ModelResponse:
     """Validate a user exists and return their active work order information."""
 
     try:
@@ -103,17 +104,19 @@ def get_user_status(employee_id: str) -> UserStatusResponse:
             detail="DB_ERROR",
         ) from exc
 
-    return UserStatusResponse(
-        user_id=int(user_row["UserPK"]),
-        first_name=str(user_row.get("FirstName") or ""),
-        last_name=str(user_row.get("LastName") or ""),
-        work_order_collection_id=_safe_get(work_order_row, "WorkOrderCollectionPK"),
-        work_order_number=_safe_get(work_order_row, "WorkOrderNumber"),
-        work_order_assembly_number=_safe_get(
-            work_order_row, "WorkOrderAssemblyNumber"
-        ),
-        clock_in_time=_safe_get(work_order_row, "TimeOn"),
-        part_number=_safe_get(work_order_row, "PartNumber"),
-        operation_code=_safe_get(work_order_row, "OperationCode"),
-        operation_name=_safe_get(work_order_row, "OperationName"),
+    return ModelResponse(
+        UserStatusResponse(
+            user_id=int(user_row["UserPK"]),
+            first_name=str(user_row.get("FirstName") or ""),
+            last_name=str(user_row.get("LastName") or ""),
+            work_order_collection_id=_safe_get(work_order_row, "WorkOrderCollectionPK"),
+            work_order_number=_safe_get(work_order_row, "WorkOrderNumber"),
+            work_order_assembly_number=_safe_get(
+                work_order_row, "WorkOrderAssemblyNumber"
+            ),
+            clock_in_time=_safe_get(work_order_row, "TimeOn"),
+            part_number=_safe_get(work_order_row, "PartNumber"),
+            operation_code=_safe_get(work_order_row, "OperationCode"),
+            operation_name=_safe_get(work_order_row, "OperationName"),
+        )
     )
@@ -0,0 +1,103 @@
+"""Compare per-request CPU time of response serialization paths.
+
+Runs each endpoint's response model through FastAPI's default
+``response_model`` path (``serialize_response`` + ``JSONResponse``) and
+through :class:`app.responses.ModelResponse`, reporting microseconds of
+process CPU time per response.
+
+Usage::
+
+    python benchmarks/bench_responses.py [iterations]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.responses import ModelResponse  # noqa: E402
+from app.schemas import (  # noqa: E402
+    ClockInResponse,
+    ClockOutResponse,
+    UserStatusResponse,
+)
+
+_SAMPLES: dict[str, BaseModel] = {
+    "clock-in": ClockInResponse(status="OK", work_order_collection_id=123456),
+    "clock-out": ClockOutResponse(status="OK"),
+    "users": UserStatusResponse(
+        user_id=42,
+        first_name="Ada",
+        last_name="Lovelace",
+        work_order_collection_id=123456,
+        work_order_number="WO-000123",
+        work_order_assembly_number=3,
+        clock_in_time=datetime(2024, 1, 1, 8, 0, 0),
+        part_number="PN-42-A",
+        operation_code="OP10",
+        operation_name="Assembly",
+    ),
+}
+
+
+def _default_path(model: BaseModel) -> Callable[[], Awaitable[bytes]]:
+    """Build a callable mirroring FastAPI's ``response_model`` handling."""
+
+    field = create_response_field(name="Response", type_=type(model))
+
+    async def run() -> bytes:
+        content = await serialize_response(
+            field=field, response_content=model, is_coroutine=False
+        )
+        return JSONResponse(content).body
+
+    return run
+
+
+def _model_response_path(model: BaseModel) -> Callable[[], Awaitable[bytes]]:
+    """Build a callable rendering the model through ``ModelResponse``."""
+
+    async def run() -> bytes:
+        return ModelResponse(model).body
+
+    return run
+
+
+async def _cpu_time_us(run: Callable[[], Awaitable[bytes]], iterations: int) -> float:
+    """Return the mean process CPU time of ``run`` in microseconds."""
+
+    for _ in range(min(iterations, 1000)):
+        await run()
+    start = time.process_time()
+    for _ in range(iterations):
+        await run()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+async def _main(iterations: int) -> None:
+    print(f"{'endpoint':<10} {'default (us)':>13} {'model (us)':>11} {'speedup':>8}")
+    for name, model in _SAMPLES.items():
+        default_run = _default_path(model)
+        model_run = _model_response_path(model)
+        assert await default_run() == await model_run()
+        default_us = await _cpu_time_us(default_run, iterations)
+        model_us = await _cpu_time_us(model_run, iterations)
+        print(
+            f"{name:<10} {default_us:>13.2f} {model_us:>11.2f} "
+            f"{default_us / model_us:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
@@ -0,0 +1,45 @@
+"""Tests for the model-backed JSON response class."""
+
+from __future__ import annotations
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from app.responses import ModelResponse  # noqa: E402
+from app.schemas import ClockInResponse, UserStatusResponse  # noqa: E402
+
+
+def test_model_response_uses_aliases() -> None:
+    """The rendered body uses the camelCase field aliases."""
+
+    response = ModelResponse(
+        ClockInResponse(status="OK", work_order_collection_id=7)
+    )
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "status": "OK",
+        "workOrderCollectionId": 7,
+    }
+
+
+def test_model_response_matches_default_encoding() -> None:
+    """The rendered body matches FastAPI's default response encoding."""
+
+    model = UserStatusResponse(
+        user_id=42,
+        first_name="Ada",
+        last_name="Lovelace",
+        work_order_number="WO-1",
+        clock_in_time=datetime(2024, 1, 1, 8, 0, 0),
+    )
+
+    assert json.loads(ModelResponse(model).body) == jsonable_encoder(
+        model, by_alias=True
+    )